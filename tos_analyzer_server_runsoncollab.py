@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request, jsonify, abort
 import nltk
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
@@ -9,6 +9,13 @@ import base64, io
 from PIL import Image
 import pytesseract
 import os
+import gzip
+import hashlib
+
+try:
+    import brotli  # optional: enables br-encoded UI assets
+except ImportError:
+    brotli = None
 
 # --- Colab Specific Imports for Manual ngrok Setup ---
 from pyngrok import ngrok
@@ -81,105 +88,541 @@ def get_summary(text):
     summarized_text = tokenizer.decode(outputs[0], skip_special_tokens=True)
     return summarized_text.strip()
 
-# --- Utility to Serve the HTML (Index Route) ---
-@app.route("/")
-def serve_index():
-    """Serves the main HTML content."""
-    # (HTML content is exactly the same as the previous version)
-    html_content = """
+
+# --- Static UI assets (built once at startup) ---
+# The page ships as separate HTML, CSS and JS. The CSS is a prebuilt subset of
+# the Tailwind utilities the markup uses, so first paint no longer waits for the
+# Tailwind CDN runtime to compile styles in the browser.
+APP_CSS = r"""
+/* Base reset (the subset of Tailwind's preflight this page relies on) */
+*, ::before, ::after {
+    box-sizing: border-box;
+    border-width: 0;
+    border-style: solid;
+    border-color: #e5e7eb;
+}
+html {
+    line-height: 1.5;
+    -webkit-text-size-adjust: 100%;
+}
+body, h1, h2, h3, h4, p, ul { margin: 0; }
+h1, h2, h3, h4 { font-size: inherit; font-weight: inherit; }
+ul { list-style: none; padding: 0; }
+button, textarea {
+    font: inherit;
+    color: inherit;
+    margin: 0;
+    padding: 0;
+}
+button { background-color: transparent; cursor: pointer; }
+textarea { resize: vertical; }
+svg, video, canvas { display: block; vertical-align: middle; }
+video, canvas { max-width: 100%; height: auto; }
+[hidden] { display: none; }
+
+
+/* Page styles */
+body {
+    font-family: 'Inter', sans-serif;
+    background-color: #0b0c10;
+    color: #c5c6c7;
+}
+.container-bg {
+    background-color: #1f2833;
+}
+.text-area-bg {
+    background-color: #2c3a4d;
+    border: 1px solid #45a29e;
+}
+.btn-primary {
+    background-color: #6610f2;
+    transition: background-color 0.3s ease;
+}
+.btn-primary:hover {
+    background-color: #560ed5;
+}
+.btn-secondary {
+    background-color: #45a29e;
+    transition: background-color 0.3s ease;
+}
+.btn-secondary:hover {
+    background-color: #388a85;
+}
+.risk-bar {
+    background-color: #45a29e;
+}
+.risk-bg {
+    background-color: #2c3a4d;
+}
+.loading-animation {
+    border-top-color: #45a29e;
+    border-left-color: #45a29e;
+    border-bottom-color: transparent;
+    border-right-color: transparent;
+    animation: spin 1s linear infinite;
+}
+@keyframes spin {
+    0% { transform: rotate(0deg); }
+    100% { transform: rotate(360deg); }
+}
+.modal {
+    background-color: rgba(0, 0, 0, 0.8);
+    backdrop-filter: blur(5px);
+}
+#video {
+    border-radius: 1rem;
+    max-width: 100%;
+}
+
+.circular-progress {
+    position: relative;
+    width: 120px;
+    height: 120px;
+    margin: auto;
+}
+.circular-progress svg {
+    transform: rotate(-90deg);
+}
+.circular-progress-bg {
+    fill: none;
+    stroke: #2c3a4d;
+    stroke-width: 12;
+}
+.circular-progress-bar {
+    fill: none;
+    stroke-width: 12;
+    stroke-linecap: round;
+    transition: stroke-dashoffset 0.5s ease-in-out;
+}
+.circular-progress-text {
+    fill: white;
+    font-size: 2rem;
+    font-weight: bold;
+    text-anchor: middle;
+    dominant-baseline: middle;
+}
+.safe .circular-progress-bar { stroke: #45a29e; }
+.warning .circular-progress-bar { stroke: #f0c541; }
+.unsafe .circular-progress-bar { stroke: #e31b54; }
+
+/* Utilities (only the classes used by the markup and by app.js) */
+.relative { position: relative; }
+.absolute { position: absolute; }
+.fixed { position: fixed; }
+.inset-0 { top: 0; right: 0; bottom: 0; left: 0; }
+.top-2 { top: 0.5rem; }
+.right-2 { right: 0.5rem; }
+.z-50 { z-index: 50; }
+.flex { display: flex; }
+.flex-1 { flex: 1 1 0%; }
+.flex-grow { flex-grow: 1; }
+.flex-col { flex-direction: column; }
+.items-center { align-items: center; }
+.items-start { align-items: flex-start; }
+.justify-center { justify-content: center; }
+.space-x-2 > :not([hidden]) ~ :not([hidden]) { margin-left: 0.5rem; }
+.space-x-3 > :not([hidden]) ~ :not([hidden]) { margin-left: 0.75rem; }
+.space-x-4 > :not([hidden]) ~ :not([hidden]) { margin-left: 1rem; }
+.space-y-1 > :not([hidden]) ~ :not([hidden]) { margin-top: 0.25rem; }
+.space-y-4 > :not([hidden]) ~ :not([hidden]) { margin-top: 1rem; }
+.space-y-6 > :not([hidden]) ~ :not([hidden]) { margin-top: 1.5rem; }
+.w-full { width: 100%; }
+.w-11\/12 { width: 91.666667%; }
+.w-16 { width: 4rem; }
+.h-2 { height: 0.5rem; }
+.h-16 { height: 4rem; }
+.h-auto { height: auto; }
+.min-h-screen { min-height: 100vh; }
+.max-w-md { max-width: 28rem; }
+.max-w-2xl { max-width: 42rem; }
+.max-w-7xl { max-width: 80rem; }
+.p-4 { padding: 1rem; }
+.p-6 { padding: 1.5rem; }
+.p-8 { padding: 2rem; }
+.px-4 { padding-left: 1rem; padding-right: 1rem; }
+.px-6 { padding-left: 1.5rem; padding-right: 1.5rem; }
+.px-8 { padding-left: 2rem; padding-right: 2rem; }
+.px-12 { padding-left: 3rem; padding-right: 3rem; }
+.py-1\.5 { padding-top: 0.375rem; padding-bottom: 0.375rem; }
+.py-3 { padding-top: 0.75rem; padding-bottom: 0.75rem; }
+.py-4 { padding-top: 1rem; padding-bottom: 1rem; }
+.mb-1 { margin-bottom: 0.25rem; }
+.mb-4 { margin-bottom: 1rem; }
+.mb-6 { margin-bottom: 1.5rem; }
+.mb-8 { margin-bottom: 2rem; }
+.mt-1 { margin-top: 0.25rem; }
+.mt-2 { margin-top: 0.5rem; }
+.mt-4 { margin-top: 1rem; }
+.mt-6 { margin-top: 1.5rem; }
+.mt-8 { margin-top: 2rem; }
+.rounded-lg { border-radius: 0.5rem; }
+.rounded-xl { border-radius: 0.75rem; }
+.rounded-2xl { border-radius: 1rem; }
+.rounded-full { border-radius: 9999px; }
+.border-4 { border-width: 4px; }
+.bg-gray-800 { background-color: #1f2937; }
+.text-center { text-align: center; }
+.text-xs { font-size: 0.75rem; line-height: 1rem; }
+.text-sm { font-size: 0.875rem; line-height: 1.25rem; }
+.text-lg { font-size: 1.125rem; line-height: 1.75rem; }
+.text-xl { font-size: 1.25rem; line-height: 1.75rem; }
+.text-3xl { font-size: 1.875rem; line-height: 2.25rem; }
+.font-medium { font-weight: 500; }
+.font-semibold { font-weight: 600; }
+.font-bold { font-weight: 700; }
+.leading-relaxed { line-height: 1.625; }
+.list-disc { list-style-type: disc; }
+.list-inside { list-style-position: inside; }
+.text-white { color: #fff; }
+.text-gray-300 { color: #d1d5db; }
+.text-gray-400 { color: #9ca3af; }
+.text-yellow-400 { color: #facc15; }
+.placeholder\:text-gray-400::placeholder { color: #9ca3af; }
+.shadow-lg { box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -4px rgba(0, 0, 0, 0.1); }
+.shadow-2xl { box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25); }
+.shadow-purple-600\/50 { box-shadow: 0 10px 15px -3px rgba(147, 51, 234, 0.5), 0 4px 6px -4px rgba(147, 51, 234, 0.5); }
+.transition-all {
+    transition-property: all;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
+    transition-duration: 150ms;
+}
+.transition-colors {
+    transition-property: color, background-color, border-color, fill, stroke;
+    transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
+    transition-duration: 150ms;
+}
+.duration-500 { transition-duration: 500ms; }
+.focus\:outline-none:focus { outline: 2px solid transparent; outline-offset: 2px; }
+.focus\:ring-2:focus { box-shadow: 0 0 0 2px #45a29e; }
+.hidden { display: none; }
+
+@media (min-width: 640px) {
+    .sm\:flex-row { flex-direction: row; }
+    .sm\:space-x-4 > :not([hidden]) ~ :not([hidden]) { margin-left: 1rem; }
+    .sm\:space-y-0 > :not([hidden]) ~ :not([hidden]) { margin-top: 0; }
+}
+@media (min-width: 1024px) {
+    .lg\:flex-row { flex-direction: row; }
+    .lg\:items-start { align-items: flex-start; }
+    .lg\:space-x-8 > :not([hidden]) ~ :not([hidden]) { margin-left: 2rem; }
+    .lg\:mb-0 { margin-bottom: 0; }
+    .lg\:w-full { width: 100%; }
+}
+"""
+
+APP_JS = """
+// DOM Elements
+const app = document.getElementById('app');
+const mainContent = document.getElementById('main-content');
+const inputSection = document.getElementById('input-section');
+const loadingState = document.getElementById('loading-state');
+const resultsSection = document.getElementById('results-section');
+const tosInput = document.getElementById('tos-input');
+const analyzeBtn = document.getElementById('analyze-btn');
+const pasteBtn = document.getElementById('paste-btn');
+const clearBtn = document.getElementById('clear-btn');
+const uploadBtn = document.getElementById('upload-btn');
+const fileInput = document.getElementById('file-input');
+const takePhotoBtn = document.getElementById('take-photo-btn');
+const cameraModal = document.getElementById('camera-modal');
+const videoElement = document.getElementById('video');
+const canvasElement = document.getElementById('canvas');
+const captureBtn = document.getElementById('capture-btn');
+const closeCameraBtn = document.getElementById('close-camera-btn');
+const riskScoresContainer = document.getElementById('risk-scores');
+const summaryElement = document.getElementById('summary');
+const aggressiveLanguageList = document.getElementById('aggressive-language');
+const suspiciousClausesList = document.getElementById('suspicious-clauses');
+const loadingText = document.getElementById('loading-text');
+const safetyScoreSection = document.getElementById('safety-score-section');
+const safetyPercentageText = document.getElementById('safety-percentage-text');
+const safetyStatus = document.getElementById('safety-status');
+const safetyProgressBar = document.querySelector('.circular-progress-bar');
+
+let videoStream = null;
+
+// Function to show/hide sections
+const showSection = (section, message = "") => {
+    mainContent.classList.add('hidden');
+    loadingState.classList.add('hidden');
+    cameraModal.classList.add('hidden');
+
+    if (section === 'input') {
+        mainContent.classList.remove('hidden');
+        resultsSection.classList.add('hidden');
+        inputSection.classList.remove('lg:w-full');
+    } else if (section === 'loading') {
+        loadingState.classList.remove('hidden');
+        loadingText.textContent = message;
+    } else if (section === 'results') {
+        mainContent.classList.remove('hidden');
+        resultsSection.classList.remove('hidden');
+        inputSection.classList.add('lg:w-full');
+    } else if (section === 'camera') {
+        cameraModal.classList.remove('hidden');
+    }
+};
+
+const detectLanguageAndAnalyze = async (text) => {
+    loadingText.textContent = "Analyzing document with Hugging Face model...";
+    showSection('loading');
+
+    // CRITICAL LINK: Use relative path /analyze
+    const apiUrl = "/analyze";
+
+    const payload = { text: text };
+
+    let analyzeRetries = 0;
+    const maxRetries = 5;
+    const baseDelay = 1000;
+
+    while(analyzeRetries < maxRetries) {
+        try {
+            const response = await fetch(apiUrl, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(payload)
+            });
+
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+
+            const parsedData = await response.json();
+
+            renderResults(parsedData);
+            showSection('results');
+            return;
+        } catch(error) {
+            console.error("Analysis error: ", error);
+            analyzeRetries++;
+            if(analyzeRetries >= maxRetries) {
+                loadingText.textContent = "Analysis Failed. Check server logs in Colab.";
+                await new Promise(res => setTimeout(res, 3000));
+                showSection('input');
+                return;
+            }
+            const delay = baseDelay * Math.pow(2, analyzeRetries);
+            await new Promise(res => setTimeout(res, delay));
+        }
+    }
+};
+
+// Function to process an image and extract text using OCR
+const processImageForText = async (base64Data, mimeType) => {
+    loadingText.textContent = "Extracting text from image using OCR...";
+    showSection('loading');
+
+    // CRITICAL LINK: Use relative path /extract_text
+    const apiUrl = "/extract_text";
+
+    const payload = {
+        image: base64Data,
+        mimeType: mimeType
+    };
+
+    let retries = 0;
+    const maxRetries = 5;
+    const baseDelay = 1000;
+
+    while (retries < maxRetries) {
+        try {
+            const response = await fetch(apiUrl, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(payload)
+            });
+
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+
+            const result = await response.json();
+
+            if (result.error) {
+                 throw new Error(result.error);
+            }
+
+            tosInput.value = result.text;
+            showSection('input');
+            return;
+
+        } catch (error) {
+            console.error('Error during image analysis:', error);
+            retries++;
+            if (retries >= maxRetries) {
+                loadingText.textContent = "OCR Failed. Check Tesseract installation in Colab.";
+                await new Promise(res => setTimeout(res, 3000));
+                showSection('input');
+                return;
+            }
+            const delay = baseDelay * Math.pow(2, retries);
+            await new Promise(res => setTimeout(res, delay));
+        }
+    }
+};
+
+// Event Listeners (omitted for brevity, content is the same as previous files)
+pasteBtn.addEventListener('click', async () => {
+    try {
+        const text = await navigator.clipboard.readText();
+        tosInput.value = text;
+    } catch (err) {
+        console.error('Failed to read clipboard contents: ', err);
+    }
+});
+
+clearBtn.addEventListener('click', () => {
+    tosInput.value = '';
+    showSection('input');
+});
+
+// --- New Image/Camera Functionality ---
+uploadBtn.addEventListener('click', () => {
+    fileInput.click();
+});
+
+fileInput.addEventListener('change', (event) => {
+    const file = event.target.files[0];
+    if (file) {
+        const reader = new FileReader();
+        reader.onload = (e) => {
+            const base64Data = e.target.result.split(',')[1];
+            processImageForText(base64Data, file.type);
+        };
+        reader.readAsDataURL(file);
+    }
+});
+
+takePhotoBtn.addEventListener('click', async () => {
+    showSection('camera');
+    try {
+        videoStream = await navigator.mediaDevices.getUserMedia({ video: true, audio: false });
+        videoElement.srcObject = videoStream;
+    } catch (err) {
+        console.error("Error accessing camera: ", err);
+        showSection('input');
+    }
+});
+
+captureBtn.addEventListener('click', () => {
+    const context = canvasElement.getContext('2d');
+    canvasElement.width = videoElement.videoWidth;
+    canvasElement.height = videoElement.videoHeight;
+    context.drawImage(videoElement, 0, 0, canvasElement.width, canvasElement.height);
+
+    const base64Data = canvasElement.toDataURL('image/png').split(',')[1];
+
+    if (videoStream) {
+        videoStream.getTracks().forEach(track => track.stop());
+        videoStream = null;
+    }
+
+    processImageForText(base64Data, 'image/png');
+});
+
+closeCameraBtn.addEventListener('click', () => {
+    if (videoStream) {
+        videoStream.getTracks().forEach(track => track.stop());
+        videoStream = null;
+    }
+    showSection('input');
+});
+
+// --- Original Analyze Functionality ---
+analyzeBtn.addEventListener('click', async () => {
+    const tosText = tosInput.value.trim();
+    if (tosText === '') {
+        console.warn('Please enter some text to analyze.');
+        return;
+    }
+
+    detectLanguageAndAnalyze(tosText);
+});
+
+function renderResults(data) {
+    // ... (rest of the renderResults function logic is unchanged) ...
+    riskScoresContainer.innerHTML = '';
+    let totalRiskScore = 0;
+    data.riskScores.forEach(item => {
+        const score = Math.max(0, Math.min(5, item.score));
+        totalRiskScore += score;
+        const barWidth = (score / 5) * 100;
+        riskScoresContainer.innerHTML += `
+            <div>
+                <h3 class="text-white text-md font-medium mb-1">${item.name}</h3>
+                <div class="flex items-center space-x-4">
+                    <div class="risk-bg w-full rounded-full h-2">
+                        <div class="risk-bar h-2 rounded-full" style="width: ${barWidth}%;"></div>
+                    </div>
+                    <span class="text-gray-400 text-sm">${score}/5</span>
+                </div>
+                <p class="text-gray-400 text-xs mt-2">${item.description}</p>
+            </div>
+        `;
+    });
+
+    const avgRiskScore = data.riskScores.length > 0 ? totalRiskScore / data.riskScores.length : 0;
+    const safetyPercentage = Math.round((1 - (avgRiskScore / 5)) * 100);
+
+    safetyPercentageText.textContent = `${safetyPercentage}%`;
+
+    let statusClass = '';
+    let statusText = '';
+    if (safetyPercentage >= 60) {
+        statusClass = 'safe';
+        statusText = 'Safe';
+    } else if (safetyPercentage >= 30) {
+        statusClass = 'warning';
+        statusText = 'Potentially Unsafe';
+    } else {
+        statusClass = 'unsafe';
+        statusText = 'Unsafe';
+    }
+
+    safetyScoreSection.className = `container-bg p-6 rounded-2xl flex flex-col items-center justify-center text-center ${statusClass}`;
+    safetyStatus.textContent = statusText;
+
+    const circumference = 2 * Math.PI * 16;
+    const offset = circumference * (1 - (safetyPercentage / 100));
+    safetyProgressBar.style.strokeDasharray = circumference;
+    safetyProgressBar.style.strokeDashoffset = offset;
+
+    summaryElement.textContent = data.summary;
+
+    aggressiveLanguageList.innerHTML = '';
+    data.aggressiveLanguage.forEach(phrase => {
+        aggressiveLanguageList.innerHTML += `<li>${phrase}</li>`;
+    });
+
+    suspiciousClausesList.innerHTML = '';
+    data.suspiciousClauses.forEach(clause => {
+        suspiciousClausesList.innerHTML += `
+            <li class="flex items-start space-x-3">
+                <i class="fas fa-exclamation-triangle text-yellow-400 mt-1"></i>
+                <div class="flex-1">
+                    <h4 class="font-semibold text-white">${clause.name}</h4>
+                    <p class="text-gray-300 text-sm leading-relaxed">${clause.text}</p>
+                </div>
+            </li>
+        `;
+    });
+}
+"""
+
+INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>TOS Analyzer</title>
-    <script src="https://cdn.tailwindcss.com"></script>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css">
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-        body {
-            font-family: 'Inter', sans-serif;
-            background-color: #0b0c10;
-            color: #c5c6c7;
-        }
-        .container-bg {
-            background-color: #1f2833;
-        }
-        .text-area-bg {
-            background-color: #2c3a4d;
-            border: 1px solid #45a29e;
-        }
-        .btn-primary {
-            background-color: #6610f2;
-            transition: background-color 0.3s ease;
-        }
-        .btn-primary:hover {
-            background-color: #560ed5;
-        }
-        .btn-secondary {
-            background-color: #45a29e;
-            transition: background-color 0.3s ease;
-        }
-        .btn-secondary:hover {
-            background-color: #388a85;
-        }
-        .risk-bar {
-            background-color: #45a29e;
-        }
-        .risk-bg {
-            background-color: #2c3a4d;
-        }
-        .loading-animation {
-            border-top-color: #45a29e;
-            border-left-color: #45a29e;
-            border-bottom-color: transparent;
-            border-right-color: transparent;
-            animation: spin 1s linear infinite;
-        }
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        .modal {
-            background-color: rgba(0, 0, 0, 0.8);
-            backdrop-filter: blur(5px);
-        }
-        #video {
-            border-radius: 1rem;
-            max-width: 100%;
-        }
-
-        .circular-progress {
-            position: relative;
-            width: 120px;
-            height: 120px;
-            margin: auto;
-        }
-        .circular-progress svg {
-            transform: rotate(-90deg);
-        }
-        .circular-progress-bg {
-            fill: none;
-            stroke: #2c3a4d;
-            stroke-width: 12;
-        }
-        .circular-progress-bar {
-            fill: none;
-            stroke-width: 12;
-            stroke-linecap: round;
-            transition: stroke-dashoffset 0.5s ease-in-out;
-        }
-        .circular-progress-text {
-            fill: white;
-            font-size: 2rem;
-            font-weight: bold;
-            text-anchor: middle;
-            dominant-baseline: middle;
-        }
-        .safe .circular-progress-bar { stroke: #45a29e; }
-        .warning .circular-progress-bar { stroke: #f0c541; }
-        .unsafe .circular-progress-bar { stroke: #e31b54; }
-    </style>
+    <link rel="stylesheet" href="__APP_CSS_URL__">
+    <script type="module" src="__APP_JS_URL__"></script>
 </head>
 <body class="flex items-center justify-center min-h-screen p-4">
 
@@ -271,311 +714,79 @@ def serve_index():
             <p id="loading-text" class="mt-4 text-xl text-white">Analyzing, please wait...</p>
         </div>
     </div>
+</body>
+</html>
+"""
 
-    <script type="module">
-        // DOM Elements
-        const app = document.getElementById('app');
-        const mainContent = document.getElementById('main-content');
-        const inputSection = document.getElementById('input-section');
-        const loadingState = document.getElementById('loading-state');
-        const resultsSection = document.getElementById('results-section');
-        const tosInput = document.getElementById('tos-input');
-        const analyzeBtn = document.getElementById('analyze-btn');
-        const pasteBtn = document.getElementById('paste-btn');
-        const clearBtn = document.getElementById('clear-btn');
-        const uploadBtn = document.getElementById('upload-btn');
-        const fileInput = document.getElementById('file-input');
-        const takePhotoBtn = document.getElementById('take-photo-btn');
-        const cameraModal = document.getElementById('camera-modal');
-        const videoElement = document.getElementById('video');
-        const canvasElement = document.getElementById('canvas');
-        const captureBtn = document.getElementById('capture-btn');
-        const closeCameraBtn = document.getElementById('close-camera-btn');
-        const riskScoresContainer = document.getElementById('risk-scores');
-        const summaryElement = document.getElementById('summary');
-        const aggressiveLanguageList = document.getElementById('aggressive-language');
-        const suspiciousClausesList = document.getElementById('suspicious-clauses');
-        const loadingText = document.getElementById('loading-text');
-        const safetyScoreSection = document.getElementById('safety-score-section');
-        const safetyPercentageText = document.getElementById('safety-percentage-text');
-        const safetyStatus = document.getElementById('safety-status');
-        const safetyProgressBar = document.querySelector('.circular-progress-bar');
-
-        let videoStream = null;
-
-        // Function to show/hide sections
-        const showSection = (section, message = "") => {
-            mainContent.classList.add('hidden');
-            loadingState.classList.add('hidden');
-            cameraModal.classList.add('hidden');
-
-            if (section === 'input') {
-                mainContent.classList.remove('hidden');
-                resultsSection.classList.add('hidden');
-                inputSection.classList.remove('lg:w-full');
-            } else if (section === 'loading') {
-                loadingState.classList.remove('hidden');
-                loadingText.textContent = message;
-            } else if (section === 'results') {
-                mainContent.classList.remove('hidden');
-                resultsSection.classList.remove('hidden');
-                inputSection.classList.add('lg:w-full');
-            } else if (section === 'camera') {
-                cameraModal.classList.remove('hidden');
-            }
-        };
-
-        const detectLanguageAndAnalyze = async (text) => {
-            loadingText.textContent = "Analyzing document with Hugging Face model...";
-            showSection('loading');
-
-            // CRITICAL LINK: Use relative path /analyze
-            const apiUrl = "/analyze";
-
-            const payload = { text: text };
-
-            let analyzeRetries = 0;
-            const maxRetries = 5;
-            const baseDelay = 1000;
-
-            while(analyzeRetries < maxRetries) {
-                try {
-                    const response = await fetch(apiUrl, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(payload)
-                    });
-
-                    if (!response.ok) {
-                        throw new Error(`HTTP error! status: ${response.status}`);
-                    }
-
-                    const parsedData = await response.json();
-
-                    renderResults(parsedData);
-                    showSection('results');
-                    return;
-                } catch(error) {
-                    console.error("Analysis error: ", error);
-                    analyzeRetries++;
-                    if(analyzeRetries >= maxRetries) {
-                        loadingText.textContent = "Analysis Failed. Check server logs in Colab.";
-                        await new Promise(res => setTimeout(res, 3000));
-                        showSection('input');
-                        return;
-                    }
-                    const delay = baseDelay * Math.pow(2, analyzeRetries);
-                    await new Promise(res => setTimeout(res, delay));
-                }
-            }
-        };
-
-        // Function to process an image and extract text using OCR
-        const processImageForText = async (base64Data, mimeType) => {
-            loadingText.textContent = "Extracting text from image using OCR...";
-            showSection('loading');
-
-            // CRITICAL LINK: Use relative path /extract_text
-            const apiUrl = "/extract_text";
-
-            const payload = {
-                image: base64Data,
-                mimeType: mimeType
-            };
-
-            let retries = 0;
-            const maxRetries = 5;
-            const baseDelay = 1000;
-
-            while (retries < maxRetries) {
-                try {
-                    const response = await fetch(apiUrl, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(payload)
-                    });
-
-                    if (!response.ok) {
-                        throw new Error(`HTTP error! status: ${response.status}`);
-                    }
-
-                    const result = await response.json();
-
-                    if (result.error) {
-                         throw new Error(result.error);
-                    }
-
-                    tosInput.value = result.text;
-                    showSection('input');
-                    return;
-
-                } catch (error) {
-                    console.error('Error during image analysis:', error);
-                    retries++;
-                    if (retries >= maxRetries) {
-                        loadingText.textContent = "OCR Failed. Check Tesseract installation in Colab.";
-                        await new Promise(res => setTimeout(res, 3000));
-                        showSection('input');
-                        return;
-                    }
-                    const delay = baseDelay * Math.pow(2, retries);
-                    await new Promise(res => setTimeout(res, delay));
-                }
-            }
-        };
-
-        // Event Listeners (omitted for brevity, content is the same as previous files)
-        pasteBtn.addEventListener('click', async () => {
-            try {
-                const text = await navigator.clipboard.readText();
-                tosInput.value = text;
-            } catch (err) {
-                console.error('Failed to read clipboard contents: ', err);
-            }
-        });
-
-        clearBtn.addEventListener('click', () => {
-            tosInput.value = '';
-            showSection('input');
-        });
-
-        // --- New Image/Camera Functionality ---
-        uploadBtn.addEventListener('click', () => {
-            fileInput.click();
-        });
-
-        fileInput.addEventListener('change', (event) => {
-            const file = event.target.files[0];
-            if (file) {
-                const reader = new FileReader();
-                reader.onload = (e) => {
-                    const base64Data = e.target.result.split(',')[1];
-                    processImageForText(base64Data, file.type);
-                };
-                reader.readAsDataURL(file);
-            }
-        });
-
-        takePhotoBtn.addEventListener('click', async () => {
-            showSection('camera');
-            try {
-                videoStream = await navigator.mediaDevices.getUserMedia({ video: true, audio: false });
-                videoElement.srcObject = videoStream;
-            } catch (err) {
-                console.error("Error accessing camera: ", err);
-                showSection('input');
-            }
-        });
-
-        captureBtn.addEventListener('click', () => {
-            const context = canvasElement.getContext('2d');
-            canvasElement.width = videoElement.videoWidth;
-            canvasElement.height = videoElement.videoHeight;
-            context.drawImage(videoElement, 0, 0, canvasElement.width, canvasElement.height);
-
-            const base64Data = canvasElement.toDataURL('image/png').split(',')[1];
-
-            if (videoStream) {
-                videoStream.getTracks().forEach(track => track.stop());
-                videoStream = null;
-            }
-
-            processImageForText(base64Data, 'image/png');
-        });
+STATIC_MAX_AGE = 31536000  # one year; asset URLs change whenever their content does
 
-        closeCameraBtn.addEventListener('click', () => {
-            if (videoStream) {
-                videoStream.getTracks().forEach(track => track.stop());
-                videoStream = null;
-            }
-            showSection('input');
-        });
 
-        // --- Original Analyze Functionality ---
-        analyzeBtn.addEventListener('click', async () => {
-            const tosText = tosInput.value.trim();
-            if (tosText === '') {
-                console.warn('Please enter some text to analyze.');
-                return;
-            }
+def build_static_asset(content, mimetype):
+    """Encodes an asset once and precompresses it for every supported encoding."""
+    raw = content.strip().encode("utf-8")
+    encodings = {"identity": raw, "gzip": gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli:
+        encodings["br"] = brotli.compress(raw, quality=11)
+    return {
+        "mimetype": mimetype,
+        "digest": hashlib.sha256(raw).hexdigest()[:16],
+        "encodings": encodings,
+    }
 
-            detectLanguageAndAnalyze(tosText);
-        });
-
-        function renderResults(data) {
-            // ... (rest of the renderResults function logic is unchanged) ...
-            riskScoresContainer.innerHTML = '';
-            let totalRiskScore = 0;
-            data.riskScores.forEach(item => {
-                const score = Math.max(0, Math.min(5, item.score));
-                totalRiskScore += score;
-                const barWidth = (score / 5) * 100;
-                riskScoresContainer.innerHTML += `
-                    <div>
-                        <h3 class="text-white text-md font-medium mb-1">${item.name}</h3>
-                        <div class="flex items-center space-x-4">
-                            <div class="risk-bg w-full rounded-full h-2">
-                                <div class="risk-bar h-2 rounded-full" style="width: ${barWidth}%;"></div>
-                            </div>
-                            <span class="text-gray-400 text-sm">${score}/5</span>
-                        </div>
-                        <p class="text-gray-400 text-xs mt-2">${item.description}</p>
-                    </div>
-                `;
-            });
 
-            const avgRiskScore = data.riskScores.length > 0 ? totalRiskScore / data.riskScores.length : 0;
-            const safetyPercentage = Math.round((1 - (avgRiskScore / 5)) * 100);
-
-            safetyPercentageText.textContent = `${safetyPercentage}%`;
-
-            let statusClass = '';
-            let statusText = '';
-            if (safetyPercentage >= 60) {
-                statusClass = 'safe';
-                statusText = 'Safe';
-            } else if (safetyPercentage >= 30) {
-                statusClass = 'warning';
-                statusText = 'Potentially Unsafe';
-            } else {
-                statusClass = 'unsafe';
-                statusText = 'Unsafe';
-            }
+def send_static_asset(asset, cache_control):
+    """Sends the best precompressed variant, or 304 if the client copy is current."""
+    encoding = "identity"
+    for candidate in ("br", "gzip"):
+        if candidate in asset["encodings"] and request.accept_encodings[candidate]:
+            encoding = candidate
+            break
 
-            safetyScoreSection.className = `container-bg p-6 rounded-2xl flex flex-col items-center justify-center text-center ${statusClass}`;
-            safetyStatus.textContent = statusText;
+    # Each encoding is a distinct representation, so it needs its own strong ETag.
+    etag = asset["digest"] if encoding == "identity" else f"{asset['digest']}-{encoding}"
 
-            const circumference = 2 * Math.PI * 16;
-            const offset = circumference * (1 - (safetyPercentage / 100));
-            safetyProgressBar.style.strokeDasharray = circumference;
-            safetyProgressBar.style.strokeDashoffset = offset;
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(asset["encodings"][encoding], mimetype=asset["mimetype"])
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = cache_control
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+css_asset = build_static_asset(APP_CSS, "text/css")
+js_asset = build_static_asset(APP_JS, "text/javascript")
+# Fingerprinted names let browsers cache CSS/JS forever without going stale.
+STATIC_ASSETS = {
+    f"app.{css_asset['digest']}.css": css_asset,
+    f"app.{js_asset['digest']}.js": js_asset,
+}
+index_asset = build_static_asset(
+    INDEX_HTML
+    .replace("__APP_CSS_URL__", f"/assets/app.{css_asset['digest']}.css")
+    .replace("__APP_JS_URL__", f"/assets/app.{js_asset['digest']}.js"),
+    "text/html",
+)
 
-            summaryElement.textContent = data.summary;
 
-            aggressiveLanguageList.innerHTML = '';
-            data.aggressiveLanguage.forEach(phrase => {
-                aggressiveLanguageList.innerHTML += `<li>${phrase}</li>`;
-            });
+# --- Utility to Serve the HTML (Index Route) ---
+@app.route("/")
+def serve_index():
+    """Serves the main HTML content."""
+    # The page itself is revalidated on each load (cheap 304) so new asset URLs are picked up.
+    return send_static_asset(index_asset, "no-cache")
 
-            suspiciousClausesList.innerHTML = '';
-            data.suspiciousClauses.forEach(clause => {
-                suspiciousClausesList.innerHTML += `
-                    <li class="flex items-start space-x-3">
-                        <i class="fas fa-exclamation-triangle text-yellow-400 mt-1"></i>
-                        <div class="flex-1">
-                            <h4 class="font-semibold text-white">${clause.name}</h4>
-                            <p class="text-gray-300 text-sm leading-relaxed">${clause.text}</p>
-                        </div>
-                    </li>
-                `;
-            });
-        }
 
-    </script>
-</body>
-</html>
-"""
-    return render_template_string(html_content)
+@app.route("/assets/<path:filename>")
+def serve_asset(filename):
+    """Serves the fingerprinted CSS/JS bundles."""
+    asset = STATIC_ASSETS.get(filename)
+    if asset is None:
+        abort(404)
+    return send_static_asset(asset, f"public, max-age={STATIC_MAX_AGE}, immutable")
 
 
 # --- 2. API Routes ---